@@ -0,0 +1,117 @@
+"""
+Micro-benchmark for merge_node on large multi-editor batches.
+
+Run from the package that contains export_utils, e.g.:
+
+    python -m <package>.bench_merge_editor_results --blocks 10000 --editors 5
+
+Reports the median merge time single-threaded and with --threads merges
+running concurrently, with and without the GC pause merge_editor_results
+takes for large batches. Only merge_node is called, so the script also runs
+against revisions before merge_editor_results existed.
+"""
+import argparse
+import gc
+import statistics
+import threading
+import time
+
+from . import export_utils
+from .schema import (
+    BlockEditResult,
+    EditorResult,
+    FeedbackItem,
+    SingleEditorFeedback,
+)
+
+EDITORS = ["development", "content", "line", "copy", "brand-alignment"]
+
+
+def build_editor_results(num_blocks: int, num_editors: int) -> list:
+    """One EditorResult per editor covering every block; every third block has feedback."""
+    results = []
+    for editor in EDITORS[:num_editors]:
+        blocks = []
+        for i in range(num_blocks):
+            changed = i % 3 == 0
+            blocks.append(BlockEditResult(
+                id=f"b{i}",
+                type="paragraph",
+                level=0,
+                original_text=f"Original paragraph {i} with some words in it.",
+                suggested_text=f"Edited paragraph {i} ({editor})." if changed else None,
+                has_changes=changed,
+                feedback_edit=[SingleEditorFeedback(editor=editor, items=[FeedbackItem(
+                    issue=f"paragraph {i}",
+                    fix=f"edited paragraph {i}",
+                    impact="Clarity",
+                    rule_used=f"{editor} - Clarity",
+                )])] if changed else [],
+            ))
+        results.append(EditorResult(editor_type=editor, blocks=blocks))
+    return results
+
+
+def _timed_merge(editor_results: list) -> float:
+    started = time.perf_counter()
+    export_utils.merge_node({"editor_results": editor_results})
+    return time.perf_counter() - started
+
+
+def run_single(editor_results: list, repeat: int) -> float:
+    return statistics.median(_timed_merge(editor_results) for _ in range(repeat))
+
+
+def run_threaded(editor_results: list, repeat: int, threads: int) -> float:
+    """Median per-merge time with `threads` merges running concurrently."""
+    timings = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(repeat):
+            elapsed = _timed_merge(editor_results)
+            with lock:
+                timings.append(elapsed)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=10000)
+    parser.add_argument("--editors", type=int, default=5, choices=range(1, len(EDITORS) + 1))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    editor_results = build_editor_results(args.blocks, args.editors)
+    print(f"merge_node: {args.blocks} blocks x {args.editors} editors, median of {args.repeat}")
+
+    # Revisions without the GC pause are timed once, as shipped
+    gc_pause_min_blocks = getattr(export_utils, "GC_PAUSE_MIN_BLOCKS", None)
+    variants = [("", gc_pause_min_blocks)]
+    if gc_pause_min_blocks is not None:
+        variants.append(("without GC pause: ", float("inf")))
+
+    for label, run in [
+        ("single thread", lambda: run_single(editor_results, args.repeat)),
+        (f"{args.threads} threads", lambda: run_threaded(editor_results, args.repeat, args.threads)),
+    ]:
+        columns = []
+        for name, min_blocks in variants:
+            if min_blocks is not None:
+                export_utils.GC_PAUSE_MIN_BLOCKS = min_blocks
+            gc.collect()
+            columns.append(f"{name}{run() * 1000:8.1f} ms")
+        if gc_pause_min_blocks is not None:
+            export_utils.GC_PAUSE_MIN_BLOCKS = gc_pause_min_blocks
+        print(f"  {label:>14}: " + "   ".join(columns))
+
+
+if __name__ == "__main__":
+    main()